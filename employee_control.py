@@ -1,66 +1,373 @@
-from flask import Flask, request, jsonify
-import sqlite3
-from datetime import datetime
 import os
-from pathlib import Path
+
+if __name__ == "__main__" and os.environ.get("FLASK_ENV") != "dev":
+    # Served by gevent (see Main): patch before threading, queue and socket are
+    # imported so pool, writer and socket waits yield to other greenlets
+    from gevent import monkey
+
+    monkey.patch_all()
+
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+import json
+import sqlite3
+from datetime import datetime, timezone
+import atexit
+import hmac
+import queue
+import threading
+import time
+from contextlib import closing, contextmanager
+from functools import partial
+
+try:
+    import orjson  # optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 # ---------------------------
 # Basic configuration
 # ---------------------------
 DB_PATH = "attendance.db"  # SQLite file on disk
 ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "secret-admin")  # change in production
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "8"))  # pre-opened SQLite connections
+EVENT_WRITE_TIMEOUT = float(os.environ.get("EVENT_WRITE_TIMEOUT", "10"))  # seconds, then 503
+PORT = int(os.environ.get("PORT", "8080"))  # gevent server port (python employee_control.py)
+_ADMIN_TOKEN_BYTES = ADMIN_TOKEN.encode()  # encoded once for require_admin()
+_ROLES = frozenset(("employee", "manager", "admin"))  # mirrors the employees.role CHECK
 
 app = Flask(__name__)  # Flask application instance
 
+# ---------------------------
+# JSON (orjson when installed, stdlib json otherwise)
+# ---------------------------
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify() and request.get_json()."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+        )
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+# ---------------------------
+# SQL statements (reused verbatim so sqlite3's statement cache hits)
+# ---------------------------
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    role TEXT NOT NULL CHECK(role IN ('employee','manager','admin')),
+    created_at TEXT NOT NULL
+);
+
+-- Clock/break events, ts in UTC epoch seconds
+CREATE TABLE IF NOT EXISTS time_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id INTEGER NOT NULL,
+    event_type TEXT NOT NULL CHECK(event_type IN ('CLOCK_IN','CLOCK_OUT','BREAK_START','BREAK_END')),
+    ts INTEGER NOT NULL,
+    FOREIGN KEY(employee_id) REFERENCES employees(id)
+);
+
+-- Covering indexes for /entries (id is the rowid): per-employee ranges, and
+-- date-only / unfiltered listings, come back already in ts DESC order
+CREATE INDEX IF NOT EXISTS idx_entries_emp_ts
+ON time_entries(employee_id, ts DESC, event_type);
+CREATE INDEX IF NOT EXISTS idx_entries_ts_desc
+ON time_entries(ts DESC, employee_id, event_type);
+"""
+
+# Databases created before ts became epoch seconds store it as ISO text:
+# move the old table aside before SCHEMA_SQL, copy its rows over afterwards
+SQL_LEGACY_TS_RENAME = "ALTER TABLE time_entries RENAME TO time_entries_text_ts;"
+SQL_LEGACY_TS_COPY = """
+INSERT INTO time_entries (id, employee_id, event_type, ts)
+SELECT id, employee_id, event_type, CAST(strftime('%s', substr(ts, 1, 19)) AS INTEGER)
+FROM time_entries_text_ts;
+DROP TABLE time_entries_text_ts;
+"""
+
+SQL_INSERT_EMPLOYEE = (
+    "INSERT INTO employees (name, role, created_at) VALUES (?,?,?) RETURNING id"
+)
+SQL_INSERT_EVENT = "INSERT INTO time_entries (employee_id, event_type, ts) VALUES (?,?,?)"
+SQL_EMPLOYEE_EXISTS = "SELECT 1 FROM employees WHERE id=?"
+SQL_LIST_EMPLOYEES = (
+    "SELECT id, name, role, created_at FROM employees WHERE id > ? ORDER BY id LIMIT ?"
+)
+# ts is stored as epoch seconds but served as ISO text; filters and ORDER BY use the
+# qualified column (time_entries.ts) so they hit the index rather than the text alias
+SQL_LIST_ENTRIES = (
+    "SELECT id, employee_id, event_type,"
+    " strftime('%Y-%m-%dT%H:%M:%SZ', ts, 'unixepoch') AS ts"
+    " FROM time_entries WHERE 1=1"
+)
+
 # ---------------------------
 # Database helpers (SQLite)
 # ---------------------------
-def get_conn():
-    """Return a SQLite connection with dict-like rows."""
-    conn = sqlite3.connect(DB_PATH)
+_pool = None  # queue.Queue of open connections, created on first use
+_pool_conns = []  # every connection the pool opened, idle or checked out
+POOL_CACHE_KIB = 8000  # pooled connections mostly read, and reads are served from the mmap
+_pool_lock = threading.Lock()
+
+def get_conn(cache_kib: int = 64000):
+    """Open a new SQLite connection with dict-like rows and a cache_kib page cache."""
+    conn = sqlite3.connect(
+        DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=256
+    )
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")  # readers no longer block on writers
+    conn.execute("PRAGMA synchronous=NORMAL")  # fsync on checkpoint, not every commit
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA cache_size=-{int(cache_kib)}")  # private page cache, in KiB
+    # Reads go through a 256 MB mmap, i.e. the OS page cache shared by every connection
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA foreign_keys=ON")  # unknown employee_id fails the INSERT
     return conn
 
-def init_db():
-    """Create tables if they do not exist (idempotent)."""
-    conn = get_conn()
-    cur = conn.cursor()
-
-    # Employees table
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS employees (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            role TEXT NOT NULL CHECK(role IN ('employee','manager','admin')),
-            created_at TEXT NOT NULL
-        )
-        """
-    )
+def _get_pool():
+    """Return the connection pool, pre-filling it with DB_POOL_SIZE connections."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = queue.Queue(maxsize=DB_POOL_SIZE)
+                for _ in range(DB_POOL_SIZE):
+                    conn = get_conn(cache_kib=POOL_CACHE_KIB)
+                    _pool_conns.append(conn)
+                    pool.put(conn)
+                _pool = pool
+    return _pool
+
+@contextmanager
+def conn_ctx():
+    """Borrow a pooled connection for the duration of a `with` block."""
+    pool = _get_pool()
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
+
+def close_pool():
+    """Close every pooled connection, including checked-out ones (registered with atexit)."""
+    global _pool
+    with _pool_lock:
+        _pool = None
+        conns = _pool_conns[:]
+        _pool_conns.clear()
+    for conn in conns:
+        conn.close()
 
-    # Time entries table (clock/break events)
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS time_entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            employee_id INTEGER NOT NULL,
-            event_type TEXT NOT NULL CHECK(event_type IN ('CLOCK_IN','CLOCK_OUT','BREAK_START','BREAK_END')),
-            ts TEXT NOT NULL,
-            FOREIGN KEY(employee_id) REFERENCES employees(id)
-        )
-        """
-    )
+atexit.register(close_pool)  # don't rely on refcounting (e.g. PyPy) to close them
+
+# Employees are never deleted, so ids seen once stay valid for the process lifetime
+_emp_cache = set()
+_emp_cache_lock = threading.Lock()
+
+def remember_employee(emp_id: int):
+    """Add an employee id to the in-process existence cache."""
+    with _emp_cache_lock:
+        _emp_cache.add(emp_id)
 
-    conn.commit()
-    conn.close()
+def employee_exists(emp_id: int) -> bool:
+    """Check the in-process cache first, falling back to one SELECT on a miss."""
+    if emp_id in _emp_cache:
+        return True
+    with conn_ctx() as conn:
+        found = conn.execute(SQL_EMPLOYEE_EXISTS, (emp_id,)).fetchone() is not None
+    if found:
+        remember_employee(emp_id)
+    return found
+
+def init_db():
+    """Create tables and indexes if they do not exist (idempotent)."""
+    with conn_ctx() as conn:
+        cols = {r["name"]: r["type"] for r in conn.execute("PRAGMA table_info(time_entries)")}
+        legacy_ts = cols.get("ts") == "TEXT"
+        script = SCHEMA_SQL
+        if legacy_ts:
+            script = SQL_LEGACY_TS_RENAME + SCHEMA_SQL + SQL_LEGACY_TS_COPY
+
+        conn.execute("PRAGMA foreign_keys=OFF")  # legacy rows are copied as-is
+        try:
+            conn.executescript("BEGIN IMMEDIATE;" + script + "COMMIT;")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("ANALYZE")  # let the planner see the indexes
+
+_iso_cache = (0, "")  # (epoch second, its ISO string); swapped as one tuple
 
 def now_iso() -> str:
-    """Return current UTC-ish ISO timestamp (YYYY-MM-DDTHH:MM:SSZ)."""
-    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    """Return current UTC-ish ISO timestamp (YYYY-MM-DDTHH:MM:SSZ), formatted once per second."""
+    global _iso_cache
+    sec = int(time.time())
+    cached_sec, iso = _iso_cache
+    if sec != cached_sec:
+        iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+        _iso_cache = (sec, iso)
+    return iso
+
+def now_ts() -> int:
+    """Return the current UTC time as integer epoch seconds."""
+    return int(time.time())
+
+def _body():
+    """Parse the raw request body as a JSON object ({} if empty, None if malformed)."""
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    try:
+        data = app.json.loads(raw)  # orjson when installed
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def _employee_id(value):
+    """Return value as a positive 64-bit id (int or ASCII digit string), else None."""
+    if isinstance(value, str) and value.isascii() and value.isdigit():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        return None  # floats are not truncated, true/false are not 1/0
+    return value if 0 < value < 2**63 else None
 
 def require_admin(req) -> bool:
-    """Simple header-based admin check (for demo only)."""
-    return req.headers.get("X-ADMIN-TOKEN") == ADMIN_TOKEN
+    """Simple header-based admin check (for demo only), compared in constant time."""
+    token = req.headers.get("X-ADMIN-TOKEN", "")
+    return hmac.compare_digest(token.encode(), _ADMIN_TOKEN_BYTES)
+# ---------------------------
+# Batched event writer
+# ---------------------------
+_write_q = queue.SimpleQueue()  # _PendingEvent items for the writer thread
+_writer = None
+_writer_conn = None  # the writer thread's own connection
+_writer_lock = threading.Lock()
+_STOP = object()  # queued by stop_writer() to end the writer loop
+
+class _PendingEvent:
+    """A queued time entry plus the outcome its request handler waits on."""
+    __slots__ = ("row", "done", "error")
+
+    def __init__(self, row):
+        self.row = row
+        self.done = threading.Event()
+        self.error = None
+
+# Errors caused by one row's data; anything else (e.g. "database is locked") fails the batch
+_ROW_ERRORS = (sqlite3.IntegrityError, OverflowError)
+
+def _write_batch(conn, batch):
+    """Insert a batch of _PendingEvent rows in one transaction, recording per-row errors."""
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(SQL_INSERT_EVENT, [p.row for p in batch])
+        conn.execute("COMMIT")
+    except _ROW_ERRORS:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        # One bad row (e.g. unknown employee) fails the batch; retry row by row
+        for i, p in enumerate(batch):
+            try:
+                conn.execute(SQL_INSERT_EVENT, p.row)
+            except _ROW_ERRORS as exc:
+                p.error = exc
+            except Exception as exc:
+                for rest in batch[i:]:  # don't wait out the busy timeout once per row
+                    rest.error = exc
+                break
+    except Exception as exc:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        for p in batch:
+            p.error = exc
+
+def _writer_loop(conn):
+    """Drain the queue, inserting each burst of events in a single transaction."""
+    while True:
+        batch = [_write_q.get()]
+        while True:
+            try:
+                batch.append(_write_q.get_nowait())
+            except queue.Empty:
+                break
+        stop = any(p is _STOP for p in batch)
+        batch = [p for p in batch if p is not _STOP]
+
+        try:
+            _write_batch(conn, batch)
+        except Exception as exc:
+            # e.g. ROLLBACK itself failed: fail whatever is still unresolved
+            for p in batch:
+                if p.error is None:
+                    p.error = exc
+        finally:
+            for p in batch:
+                p.done.set()
+
+        if stop:
+            conn.close()
+            return
+
+def _start_writer():
+    """Start the writer thread with its own connection, or restart it if it died."""
+    global _writer, _writer_conn
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            if _writer_conn is not None:
+                _writer_conn.close()  # left behind by a dead thread
+            _writer_conn = get_conn()
+            thread = threading.Thread(
+                target=_writer_loop, args=(_writer_conn,), name="event-writer", daemon=True
+            )
+            thread.start()
+            _writer = thread
+
+def insert_event(employee_id, event_type, ts):
+    """Queue a time entry and block until the writer has committed it (or timed out)."""
+    if _writer is None or not _writer.is_alive():
+        _start_writer()
+    pending = _PendingEvent((employee_id, event_type, ts))
+    _write_q.put(pending)
+    if not pending.done.wait(EVENT_WRITE_TIMEOUT):
+        # The row stays queued and may still be written after the caller gives up
+        raise TimeoutError("event writer did not respond")
+    if pending.error is not None:
+        raise pending.error
+
+def stop_writer():
+    """Flush queued events and close the writer's connection (registered with atexit)."""
+    global _writer, _writer_conn
+    with _writer_lock:
+        thread, conn = _writer, _writer_conn
+        _writer = _writer_conn = None
+    if thread is not None and thread.is_alive():
+        _write_q.put(_STOP)
+        thread.join(timeout=5)
+    if conn is not None and (thread is None or not thread.is_alive()):
+        conn.close()  # no-op if the loop already closed it
+
+atexit.register(stop_writer)
 # ---------------------------
 # Public endpoints (employees)
 # ---------------------------
@@ -68,137 +375,107 @@ def require_admin(req) -> bool:
 @app.post("/register")
 def register_employee():
     """Register a new employee (name + role)."""
-    data = request.get_json(silent=True) or {}
+    data = _body()
+    if data is None:
+        return jsonify(error="Malformed JSON body"), 400
     name = (data.get("name") or "").strip()
     role = (data.get("role") or "employee").strip().lower()
 
-    if not name or role not in ("employee", "manager", "admin"):
+    if not name or role not in _ROLES:
         return jsonify(error="Bad payload: name required, role in {employee, manager, admin}"), 400
 
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO employees (name, role, created_at) VALUES (?,?,?)",
-        (name, role, now_iso()),
-    )
-    emp_id = cur.lastrowid
-    conn.commit()
-    conn.close()
+    # Single autocommit statement: no explicit transaction, no lastrowid lookup
+    with conn_ctx() as conn:
+        (emp_id,) = conn.execute(SQL_INSERT_EMPLOYEE, (name, role, now_iso())).fetchone()
+    remember_employee(emp_id)
 
     return jsonify(id=emp_id, name=name, role=role), 201
 
 
-@app.post("/clock-in")
-def clock_in():
-    """Record a clock-in event."""
-    data = request.get_json(silent=True) or {}
-    employee_id = data.get("employee_id")
-    if not employee_id:
-        return jsonify(error="employee_id required"), 400
+def _record_event(event_type, message):
+    """Insert a time entry for the posted employee_id."""
+    data = _body()
+    if data is None:
+        return jsonify(error="Malformed JSON body"), 400
+    employee_id = _employee_id(data.get("employee_id"))
+    if employee_id is None:
+        return jsonify(error="employee_id required (positive integer)"), 400
 
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("SELECT id FROM employees WHERE id=?", (employee_id,))
-    if not cur.fetchone():
-        conn.close()
+    if not employee_exists(employee_id):
         return jsonify(error="Employee not found"), 404
 
-    cur.execute(
-        "INSERT INTO time_entries (employee_id, event_type, ts) VALUES (?,?,?)",
-        (employee_id, "CLOCK_IN", now_iso()),
-    )
-    conn.commit()
-    conn.close()
-    return jsonify(message="Clock-in recorded"), 201
-
-
-@app.post("/clock-out")
-def clock_out():
-    """Record a clock-out event."""
-    data = request.get_json(silent=True) or {}
-    employee_id = data.get("employee_id")
-    if not employee_id:
-        return jsonify(error="employee_id required"), 400
-
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("SELECT id FROM employees WHERE id=?", (employee_id,))
-    if not cur.fetchone():
-        conn.close()
-        return jsonify(error="Employee not found"), 404
-
-    cur.execute(
-        "INSERT INTO time_entries (employee_id, event_type, ts) VALUES (?,?,?)",
-        (employee_id, "CLOCK_OUT", now_iso()),
-    )
-    conn.commit()
-    conn.close()
-    return jsonify(message="Clock-out recorded"), 201
-
-
-@app.post("/break-start")
-def break_start():
-    """Record the start of a break."""
-    data = request.get_json(silent=True) or {}
-    employee_id = data.get("employee_id")
-    if not employee_id:
-        return jsonify(error="employee_id required"), 400
- 
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("SELECT id FROM employees WHERE id=?", (employee_id,))
-    if not cur.fetchone():
-        conn.close()
+    try:
+        insert_event(employee_id, event_type, now_ts())
+    except sqlite3.IntegrityError:
         return jsonify(error="Employee not found"), 404
-
-    cur.execute(
-        "INSERT INTO time_entries (employee_id, event_type, ts) VALUES (?,?,?)",
-        (employee_id, "BREAK_START", now_iso()),
+    except (sqlite3.OperationalError, TimeoutError):
+        return jsonify(error="Database busy, retry later"), 503
+    return jsonify(message=message), 201
+
+
+# URL -> (event_type, success message); endpoints keep the old view names (clock_in, ...)
+_EVENT_ROUTES = {
+    "/clock-in": ("CLOCK_IN", "Clock-in recorded"),
+    "/clock-out": ("CLOCK_OUT", "Clock-out recorded"),
+    "/break-start": ("BREAK_START", "Break started"),
+    "/break-end": ("BREAK_END", "Break ended"),
+}
+
+for _path, (_event_type, _message) in _EVENT_ROUTES.items():
+    app.add_url_rule(
+        _path,
+        _event_type.lower(),
+        partial(_record_event, _event_type, _message),
+        methods=["POST"],
     )
-    conn.commit()
-    conn.close()
-    return jsonify(message="Break started"), 201
-
-
-@app.post("/break-end")
-def break_end():
-    """Record the end of a break."""
-    data = request.get_json(silent=True) or {}
-    employee_id = data.get("employee_id")
-    if not employee_id:
-        return jsonify(error="employee_id required"), 400
-
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("SELECT id FROM employees WHERE id=?", (employee_id,))
-    if not cur.fetchone():
-        conn.close()
-        return jsonify(error="Employee not found"), 404
-
-    cur.execute(
-        "INSERT INTO time_entries (employee_id, event_type, ts) VALUES (?,?,?)",
-        (employee_id, "BREAK_END", now_iso()),
-    )
-    conn.commit()
-    conn.close()
-    return jsonify(message="Break ended"), 201
 # ---------------------------
 # Admin endpoints (read-only)
 # ---------------------------
 
+def _stream_rows(sql, params, columns):
+    """Return a JSON array response streamed from the cursor in fetchmany batches."""
+    def generate():
+        # Close the cursor even on early exit (client gone), so the pooled
+        # connection doesn't keep an open read snapshot that blocks checkpoints
+        with conn_ctx() as conn, closing(conn.cursor()) as cur:
+            cur.row_factory = None  # plain tuples, zipped with `columns` below
+            cur.arraysize = 1000
+            cur.execute(sql, params)
+            yield b"["
+            sep = b""
+            while True:
+                rows = cur.fetchmany()
+                if not rows:
+                    break
+                # One dumps() per batch; strip its brackets to splice batches together
+                yield sep + _dumps([dict(zip(columns, r)) for r in rows])[1:-1]
+                sep = b","
+            yield b"]"
+
+    return Response(generate(), status=200, mimetype="application/json")
+
+
 @app.get("/employees")
 def list_employees():
-    """List all employees (admin-only)."""
+    """List employees one page at a time, keyed by id (admin-only)."""
     if not require_admin(request):
         return jsonify(error="Admin token required"), 403
 
-    conn = get_conn()
-    cur = conn.cursor()
-    rows = cur.execute(
-        "SELECT id, name, role, created_at FROM employees ORDER BY id"
-    ).fetchall()
-    conn.close()
-    return jsonify([dict(r) for r in rows]), 200
+    try:
+        cursor = int(request.args.get("cursor", 0))  # last id of the previous page
+        limit = min(int(request.args.get("limit", 100)), 1000)
+    except ValueError:
+        return jsonify(error="cursor and limit must be integers"), 400
+    if limit < 1:
+        return jsonify(error="limit must be at least 1"), 400
+    if not 0 <= cursor < 2**63:  # SQLite INTEGER range
+        return jsonify(error="cursor out of range"), 400
+
+    with conn_ctx() as conn:
+        rows = conn.execute(SQL_LIST_EMPLOYEES, (cursor, limit)).fetchall()
+    items = [dict(r) for r in rows]
+    next_cursor = items[-1]["id"] if len(items) == limit else None
+    return jsonify(items=items, next_cursor=next_cursor), 200
 
 
 @app.get("/entries")
@@ -210,32 +487,42 @@ def list_entries():
     employee_id = request.args.get("employee_id")
     date = request.args.get("date")  # YYYY-MM-DD
 
-    sql = "SELECT id, employee_id, event_type, ts FROM time_entries WHERE 1=1"
+    sql = SQL_LIST_ENTRIES
     params = []
     if employee_id:
         sql += " AND employee_id=?"
         params.append(employee_id)
     if date:
-        sql += " AND ts LIKE ?"
-        params.append(f"{date}%")
+        try:
+            day = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return jsonify(error="date must be YYYY-MM-DD"), 400
+        start = int(day.timestamp())
+        sql += " AND time_entries.ts >= ? AND time_entries.ts < ?"
+        params += [start, start + 86400]
+
+    sql += " ORDER BY time_entries.ts DESC"
 
-    sql += " ORDER BY ts DESC"
+    return _stream_rows(sql, params, ("id", "employee_id", "event_type", "ts"))
+# ---------------------------
+# Startup
+# ---------------------------
+def create_app():
+    """Create the schema once at startup and return the app (WSGI entry point)."""
+    init_db()
+    return app
 
-    conn = get_conn()
-    cur = conn.cursor()
-    rows = cur.execute(sql, params).fetchall()
-    conn.close()
-    return jsonify([dict(r) for r in rows]), 200
 # ---------------------------
 # Main
 # ---------------------------
 if __name__ == "__main__":
-    # Ensure DB and tables exist
-    if not Path(DB_PATH).exists():
-        init_db()
-    else:
-        # Safe to call again in case schema is missing
-        init_db()
+    create_app()
 
-    app.run(debug=True)
+    if os.environ.get("FLASK_ENV") == "dev":
+        app.run(debug=True)  # Werkzeug dev server with reloader, development only
+    else:
+        from gevent.pywsgi import WSGIServer
 
+        # The stdlib is monkey-patched at the top of the module, so waits on the pool
+        # and the event writer yield; sqlite3 calls themselves still run on the hub
+        WSGIServer(("0.0.0.0", PORT), app).serve_forever()
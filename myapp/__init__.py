@@ -1,19 +1,28 @@
+import hmac
+
 from flask import Flask, request, jsonify
 
 app = Flask(__name__)
 
+# Demo credentials, pre-encoded for constant-time comparison
+_USERNAME = b"admin"
+_PASSWORD = b"1234"
+
 @app.post("/login")
 def login():
     data = request.get_json(silent=True) or {}
-    username = (data.get("username") or "").strip()
-    password = (data.get("password") or "").strip()
+    # surrogatepass: never crash on, or silently drop, odd code points
+    username = (data.get("username") or "").encode("utf-8", "surrogatepass").strip()
+    password = (data.get("password") or "").encode("utf-8", "surrogatepass").strip()
 
     # Validate empty fields
     if not username or not password:
         return jsonify(error="Missing username or password."), 400
 
-    # Correct credentials
-    if username == "admin" and password == "1234":
+    # Correct credentials (both compared, so timing doesn't reveal which one failed)
+    username_ok = hmac.compare_digest(username, _USERNAME)
+    password_ok = hmac.compare_digest(password, _PASSWORD)
+    if username_ok and password_ok:
         return jsonify(message="Access granted ✅"), 200
 
     # Incorrect credentials
@@ -0,0 +1,31 @@
+"""Optional build: compile employee_control.py into a C extension with Cython.
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The compiled module is imported in place of employee_control.py when present;
+without Cython (or without building) the pure-Python module is used as-is.
+
+Smoke check after building (the path must end in .so, not .py), then run the
+test suite against the compiled module:
+
+    python -c 'import employee_control; print(employee_control.__file__)'
+    python -m pytest -q
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["employee_control.py"],
+        compiler_directives={"language_level": "3"},
+    )
+
+setup(
+    name="employee-control",
+    py_modules=["employee_control"],
+    ext_modules=ext_modules,
+)
@@ -30,4 +30,10 @@ def test_login_missing_fields():
     assert resp.status_code == 400
     assert "Missing username or password" in resp.get_json()["error"]
 
-
+def test_login_strips_whitespace():
+    resp = client.post(
+        "/login",
+        data=json.dumps({"username": " admin ", "password": "1234 "}),
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
@@ -0,0 +1,238 @@
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+
+import pytest
+
+import employee_control
+
+# Point the app at a throwaway database before the pool is created
+employee_control.DB_PATH = os.path.join(tempfile.mkdtemp(), "attendance.db")
+employee_control.init_db()
+
+client = employee_control.app.test_client()
+ADMIN = {"X-ADMIN-TOKEN": employee_control.ADMIN_TOKEN}
+
+
+def _post(path, payload):
+    return client.post(path, data=json.dumps(payload), content_type="application/json")
+
+
+def _register(name="Ana", role="employee"):
+    return _post("/register", {"name": name, "role": role}).get_json()["id"]
+
+
+def test_register_ok():
+    resp = _post("/register", {"name": "  Luis ", "role": "Manager"})
+    assert resp.status_code == 201
+    body = resp.get_json()
+    assert body["name"] == "Luis"
+    assert body["role"] == "manager"
+
+
+def test_register_bad_role():
+    resp = _post("/register", {"name": "Luis", "role": "boss"})
+    assert resp.status_code == 400
+
+
+def test_clock_events_recorded():
+    emp_id = _register()
+    for path in ("/clock-in", "/break-start", "/break-end", "/clock-out"):
+        assert _post(path, {"employee_id": emp_id}).status_code == 201
+
+    resp = client.get(f"/entries?employee_id={emp_id}", headers=ADMIN)
+    assert resp.status_code == 200
+    events = sorted(e["event_type"] for e in resp.get_json())
+    assert events == ["BREAK_END", "BREAK_START", "CLOCK_IN", "CLOCK_OUT"]
+
+
+def test_clock_in_unknown_employee():
+    resp = _post("/clock-in", {"employee_id": 999999})
+    assert resp.status_code == 404
+    assert "Employee not found" in resp.get_json()["error"]
+
+
+def test_clock_in_missing_employee_id():
+    assert _post("/clock-in", {}).status_code == 400
+
+
+def test_admin_endpoints_require_token():
+    assert client.get("/employees").status_code == 403
+    assert client.get("/entries").status_code == 403
+
+
+def test_list_employees():
+    emp_id = _register("Marta")
+    resp = client.get(f"/employees?cursor={emp_id - 1}", headers=ADMIN)
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["items"][0]["id"] == emp_id
+    assert body["items"][0]["name"] == "Marta"
+    assert body["next_cursor"] is None
+
+
+def test_list_employees_pagination():
+    first, second = _register("P1"), _register("P2")
+    resp = client.get(f"/employees?cursor={first - 1}&limit=1", headers=ADMIN)
+    body = resp.get_json()
+    assert [e["id"] for e in body["items"]] == [first]
+    assert body["next_cursor"] == first
+
+    resp = client.get(f"/employees?cursor={first}&limit=1", headers=ADMIN)
+    assert [e["id"] for e in resp.get_json()["items"]] == [second]
+
+    assert client.get("/employees?limit=abc", headers=ADMIN).status_code == 400
+    assert client.get(f"/employees?cursor={10**20}", headers=ADMIN).status_code == 400
+    assert client.get("/employees?cursor=-1", headers=ADMIN).status_code == 400
+
+
+def test_entries_date_filter():
+    emp_id = _register()
+    _post("/clock-in", {"employee_id": emp_id})
+    today = time.strftime("%Y-%m-%d", time.gmtime())
+
+    resp = client.get(f"/entries?employee_id={emp_id}&date={today}", headers=ADMIN)
+    assert [e["event_type"] for e in resp.get_json()] == ["CLOCK_IN"]
+    assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", resp.get_json()[0]["ts"])
+    assert resp.get_json()[0]["ts"].startswith(today)
+
+    resp = client.get(f"/entries?employee_id={emp_id}&date=2000-01-01", headers=ADMIN)
+    assert resp.get_json() == []
+
+
+def test_entries_bad_date():
+    resp = client.get("/entries?date=yesterday", headers=ADMIN)
+    assert resp.status_code == 400
+
+
+def test_malformed_json_body():
+    resp = client.post("/clock-in", data="{not json", content_type="application/json")
+    assert resp.status_code == 400
+    assert "Malformed JSON" in resp.get_json()["error"]
+
+
+def test_admin_wrong_token():
+    resp = client.get("/employees", headers={"X-ADMIN-TOKEN": "nope"})
+    assert resp.status_code == 403
+
+
+def test_writer_batch_retries_rows_individually():
+    emp_id = _register()
+    batch = [
+        employee_control._PendingEvent((emp_id, "CLOCK_IN", 1)),
+        employee_control._PendingEvent((999999, "CLOCK_IN", 2)),  # FK violation
+        employee_control._PendingEvent((10**30, "CLOCK_IN", 3)),  # not a SQLite integer
+        employee_control._PendingEvent((emp_id, "CLOCK_OUT", 4)),
+    ]
+    conn = employee_control.get_conn()
+    try:
+        employee_control._write_batch(conn, batch)
+        rows = conn.execute(
+            "SELECT event_type, ts FROM time_entries WHERE employee_id=? ORDER BY ts",
+            (emp_id,),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert batch[0].error is None and batch[3].error is None
+    assert isinstance(batch[1].error, sqlite3.IntegrityError)
+    assert batch[2].error is not None
+    assert [tuple(r) for r in rows] == [("CLOCK_IN", 1), ("CLOCK_OUT", 4)]
+
+
+def test_writer_batch_fails_fast_when_locked():
+    emp_id = _register()
+    batch = [employee_control._PendingEvent((emp_id, "CLOCK_IN", t)) for t in (1, 2, 3)]
+    blocker = sqlite3.connect(employee_control.DB_PATH, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")  # hold the write lock
+    conn = employee_control.get_conn()
+    conn.execute("PRAGMA busy_timeout=0")
+    try:
+        employee_control._write_batch(conn, batch)
+    finally:
+        blocker.execute("ROLLBACK")
+        blocker.close()
+        conn.close()
+
+    # One shared error for the whole batch: no row-by-row retry
+    assert isinstance(batch[0].error, sqlite3.OperationalError)
+    assert all(p.error is batch[0].error for p in batch)
+
+
+def test_clock_in_503_when_writer_stalls(monkeypatch):
+    emp_id = _register()
+    monkeypatch.setattr(employee_control, "EVENT_WRITE_TIMEOUT", 0.2)
+    blocker = sqlite3.connect(employee_control.DB_PATH, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")  # writer waits on its busy timeout
+    try:
+        resp = _post("/clock-in", {"employee_id": emp_id})
+    finally:
+        blocker.execute("ROLLBACK")
+        blocker.close()
+    assert resp.status_code == 503
+
+
+def test_writer_survives_bad_row():
+    emp_id = _register()
+    with pytest.raises(Exception):
+        employee_control.insert_event(10**30, "CLOCK_IN", 1)
+    assert _post("/clock-in", {"employee_id": emp_id}).status_code == 201
+
+
+def test_clock_in_employee_id_types():
+    emp_id = _register()
+    assert _post("/clock-in", {"employee_id": str(emp_id)}).status_code == 201
+    for bad in (emp_id + 0.9, True, "abc", "1.5", -1, 10**30, None):
+        resp = _post("/clock-in", {"employee_id": bad})
+        assert resp.status_code == 400, bad
+        assert "employee_id required" in resp.get_json()["error"]
+
+
+LEGACY_SCHEMA = """
+CREATE TABLE employees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    role TEXT NOT NULL CHECK(role IN ('employee','manager','admin')),
+    created_at TEXT NOT NULL
+);
+CREATE TABLE time_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_id INTEGER NOT NULL,
+    event_type TEXT NOT NULL CHECK(event_type IN ('CLOCK_IN','CLOCK_OUT','BREAK_START','BREAK_END')),
+    ts TEXT NOT NULL,
+    FOREIGN KEY(employee_id) REFERENCES employees(id)
+);
+INSERT INTO employees (id, name, role, created_at) VALUES (1, 'Ana', 'employee', '2024-01-01T00:00:00Z');
+INSERT INTO time_entries (id, employee_id, event_type, ts) VALUES
+    (5, 1, 'CLOCK_IN', '2024-01-02T08:30:00Z'),
+    (9, 7, 'CLOCK_OUT', '2024-01-02T17:00:00Z');
+"""
+
+
+def test_init_db_migrates_text_timestamps():
+    legacy_path = os.path.join(tempfile.mkdtemp(), "legacy.db")
+    conn = sqlite3.connect(legacy_path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.close()
+
+    original_path = employee_control.DB_PATH
+    employee_control.close_pool()
+    employee_control.DB_PATH = legacy_path
+    try:
+        employee_control.init_db()
+        employee_control.init_db()  # second run is a no-op
+        with employee_control.conn_ctx() as c:
+            rows = [tuple(r) for r in c.execute("SELECT * FROM time_entries ORDER BY id")]
+            ts_type = [r["type"] for r in c.execute("PRAGMA table_info(time_entries)")][3]
+            indexes = [r["name"] for r in c.execute("PRAGMA index_list(time_entries)")]
+    finally:
+        employee_control.close_pool()
+        employee_control.DB_PATH = original_path
+
+    # Ids kept (including an orphaned row), ISO text converted to UTC epoch seconds
+    assert rows == [(5, 1, "CLOCK_IN", 1704184200), (9, 7, "CLOCK_OUT", 1704214800)]
+    assert ts_type == "INTEGER"
+    assert sorted(indexes) == ["idx_entries_emp_ts", "idx_entries_ts_desc"]